@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# searches the best move for every position the computer can face and
+# writes them to opening_book.py, so the game only has to look them up
+
+import itertools
+from tictactoe import TicTacToe, Mode, State, check_game_result, canonical, FULL_BOARD
+
+OUTPUT = "opening_book.py"
+
+
+# all canonical positions which are not finished and where it is the
+# computers turn, no matter who started
+def book_positions():
+    positions = set()
+    for cells in itertools.product(range(3), repeat=9):
+        p_mask = sum(1 << i for i, cell in enumerate(cells) if cell == 1)
+        c_mask = sum(1 << i for i, cell in enumerate(cells) if cell == 2)
+        if cells.count(1) - cells.count(2) not in (0, 1):
+            continue
+        if check_game_result(p_mask, c_mask) is not None:
+            continue
+        position = canonical(p_mask, c_mask)
+        positions.add((position >> 9, position & FULL_BOARD))
+    return sorted(positions)
+
+
+def main():
+    ttt = TicTacToe(Mode.MINIMAX_AB, State.COMPUTERS_TURN)
+    book = {}
+    for p_mask, c_mask in book_positions():
+        ttt.p_mask, ttt.c_mask = p_mask, c_mask
+        book[(p_mask, c_mask)] = ttt.search_move()
+
+    with open(OUTPUT, "w") as file:
+        file.write("# generated by generate_opening_book.py, do not edit\n")
+        file.write("# maps canonical (player, computer) masks to the best move for the computer\n\n")
+        file.write("OPENING_BOOK = {\n")
+        for (p_mask, c_mask), move in book.items():
+            file.write(f"    (0b{p_mask:09b}, 0b{c_mask:09b}): {move},\n")
+        file.write("}\n")
+    print(f"wrote {len(book)} positions to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
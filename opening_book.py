@@ -0,0 +1,632 @@
+# generated by generate_opening_book.py, do not edit
+# maps canonical (player, computer) masks to the best move for the computer
+
+OPENING_BOOK = {
+    (0b000000000, 0b000000000): 4,
+    (0b000000001, 0b000000000): 4,
+    (0b000000001, 0b000000010): 4,
+    (0b000000001, 0b000000100): 6,
+    (0b000000001, 0b000010000): 2,
+    (0b000000001, 0b000100000): 2,
+    (0b000000001, 0b100000000): 2,
+    (0b000000010, 0b000000000): 4,
+    (0b000000010, 0b000000001): 4,
+    (0b000000010, 0b000001000): 4,
+    (0b000000010, 0b000010000): 0,
+    (0b000000010, 0b001000000): 4,
+    (0b000000010, 0b010000000): 4,
+    (0b000000011, 0b000000100): 8,
+    (0b000000011, 0b000001000): 2,
+    (0b000000011, 0b000001100): 4,
+    (0b000000011, 0b000010000): 2,
+    (0b000000011, 0b000010100): 6,
+    (0b000000011, 0b000011000): 5,
+    (0b000000011, 0b000100000): 2,
+    (0b000000011, 0b000100100): 8,
+    (0b000000011, 0b000101000): 4,
+    (0b000000011, 0b000110000): 3,
+    (0b000000011, 0b001000000): 2,
+    (0b000000011, 0b001000100): 4,
+    (0b000000011, 0b001001000): 2,
+    (0b000000011, 0b001010000): 2,
+    (0b000000011, 0b001100000): 2,
+    (0b000000011, 0b010000000): 2,
+    (0b000000011, 0b010000100): 6,
+    (0b000000011, 0b010001000): 2,
+    (0b000000011, 0b010010000): 2,
+    (0b000000011, 0b010100000): 2,
+    (0b000000011, 0b011000000): 8,
+    (0b000000011, 0b100000000): 2,
+    (0b000000011, 0b100000100): 5,
+    (0b000000011, 0b100001000): 2,
+    (0b000000011, 0b100010000): 2,
+    (0b000000011, 0b100100000): 2,
+    (0b000000011, 0b101000000): 7,
+    (0b000000011, 0b110000000): 6,
+    (0b000000101, 0b000000010): 4,
+    (0b000000101, 0b000001000): 1,
+    (0b000000101, 0b000001010): 4,
+    (0b000000101, 0b000010000): 1,
+    (0b000000101, 0b000010010): 7,
+    (0b000000101, 0b000011000): 5,
+    (0b000000101, 0b000101000): 4,
+    (0b000000101, 0b001000000): 1,
+    (0b000000101, 0b001000010): 7,
+    (0b000000101, 0b001001000): 1,
+    (0b000000101, 0b001010000): 1,
+    (0b000000101, 0b001100000): 1,
+    (0b000000101, 0b010000000): 1,
+    (0b000000101, 0b010000010): 4,
+    (0b000000101, 0b010001000): 1,
+    (0b000000101, 0b010010000): 1,
+    (0b000000101, 0b011000000): 8,
+    (0b000000101, 0b101000000): 7,
+    (0b000001010, 0b000000001): 4,
+    (0b000001010, 0b000000100): 8,
+    (0b000001010, 0b000000101): 4,
+    (0b000001010, 0b000010000): 0,
+    (0b000001010, 0b000010001): 8,
+    (0b000001010, 0b000010100): 6,
+    (0b000001010, 0b000100000): 0,
+    (0b000001010, 0b000100001): 8,
+    (0b000001010, 0b000100100): 8,
+    (0b000001010, 0b000110000): 2,
+    (0b000001010, 0b001000100): 4,
+    (0b000001010, 0b001100000): 2,
+    (0b000001010, 0b010100000): 8,
+    (0b000001010, 0b100000000): 2,
+    (0b000001010, 0b100000001): 4,
+    (0b000001010, 0b100000100): 5,
+    (0b000001010, 0b100010000): 0,
+    (0b000001010, 0b100100000): 2,
+    (0b000001011, 0b000010100): 6,
+    (0b000001011, 0b000100100): 8,
+    (0b000001011, 0b000110000): 2,
+    (0b000001011, 0b000110100): 6,
+    (0b000001011, 0b001000100): 4,
+    (0b000001011, 0b001100000): 2,
+    (0b000001011, 0b001100100): 4,
+    (0b000001011, 0b001110000): 2,
+    (0b000001011, 0b010100000): 4,
+    (0b000001011, 0b010100100): 8,
+    (0b000001011, 0b010110000): 2,
+    (0b000001011, 0b100000100): 5,
+    (0b000001011, 0b100010000): 2,
+    (0b000001011, 0b100010100): 6,
+    (0b000001011, 0b100100000): 2,
+    (0b000001011, 0b100110000): 2,
+    (0b000001011, 0b101000100): 4,
+    (0b000001011, 0b101100000): 2,
+    (0b000001011, 0b110100000): 2,
+    (0b000001100, 0b000000001): 4,
+    (0b000001100, 0b000000010): 4,
+    (0b000001100, 0b000000011): 4,
+    (0b000001100, 0b000010000): 0,
+    (0b000001100, 0b000010001): 8,
+    (0b000001100, 0b000010010): 7,
+    (0b000001100, 0b000100000): 0,
+    (0b000001100, 0b000100001): 4,
+    (0b000001100, 0b000100010): 4,
+    (0b000001100, 0b000110000): 0,
+    (0b000001100, 0b001000000): 4,
+    (0b000001100, 0b001000001): 8,
+    (0b000001100, 0b001000010): 7,
+    (0b000001100, 0b001010000): 8,
+    (0b000001100, 0b001100000): 4,
+    (0b000001100, 0b010000000): 4,
+    (0b000001100, 0b010000001): 4,
+    (0b000001100, 0b010000010): 4,
+    (0b000001100, 0b010010000): 1,
+    (0b000001100, 0b010100000): 4,
+    (0b000001100, 0b011000000): 8,
+    (0b000001100, 0b100000000): 6,
+    (0b000001100, 0b100000001): 4,
+    (0b000001100, 0b100000010): 4,
+    (0b000001100, 0b100010000): 0,
+    (0b000001100, 0b100100000): 0,
+    (0b000001100, 0b101000000): 7,
+    (0b000001100, 0b110000000): 6,
+    (0b000001101, 0b000010010): 7,
+    (0b000001101, 0b000100010): 6,
+    (0b000001101, 0b000110000): 6,
+    (0b000001101, 0b000110010): 7,
+    (0b000001101, 0b001000010): 7,
+    (0b000001101, 0b001010000): 1,
+    (0b000001101, 0b001010010): 7,
+    (0b000001101, 0b001100000): 1,
+    (0b000001101, 0b001100010): 7,
+    (0b000001101, 0b001110000): 1,
+    (0b000001101, 0b010000010): 4,
+    (0b000001101, 0b010010000): 1,
+    (0b000001101, 0b010100000): 4,
+    (0b000001101, 0b010100010): 4,
+    (0b000001101, 0b010110000): 1,
+    (0b000001101, 0b011000000): 8,
+    (0b000001101, 0b011000010): 4,
+    (0b000001101, 0b011010000): 8,
+    (0b000001101, 0b011100000): 8,
+    (0b000001101, 0b100000010): 6,
+    (0b000001101, 0b100010000): 6,
+    (0b000001101, 0b100010010): 7,
+    (0b000001101, 0b100100000): 4,
+    (0b000001101, 0b100100010): 6,
+    (0b000001101, 0b100110000): 6,
+    (0b000001101, 0b101000000): 7,
+    (0b000001101, 0b101000010): 7,
+    (0b000001101, 0b101010000): 7,
+    (0b000001101, 0b101100000): 7,
+    (0b000001101, 0b110000000): 6,
+    (0b000001101, 0b110000010): 4,
+    (0b000001101, 0b110010000): 6,
+    (0b000001101, 0b110100000): 6,
+    (0b000001110, 0b000010001): 8,
+    (0b000001110, 0b000100001): 4,
+    (0b000001110, 0b000110000): 0,
+    (0b000001110, 0b000110001): 8,
+    (0b000001110, 0b001000001): 8,
+    (0b000001110, 0b001010000): 0,
+    (0b000001110, 0b001010001): 8,
+    (0b000001110, 0b001100000): 0,
+    (0b000001110, 0b001100001): 8,
+    (0b000001110, 0b001110000): 0,
+    (0b000001110, 0b010000001): 8,
+    (0b000001110, 0b010010000): 0,
+    (0b000001110, 0b010010001): 8,
+    (0b000001110, 0b010100000): 0,
+    (0b000001110, 0b010100001): 8,
+    (0b000001110, 0b010110000): 0,
+    (0b000001110, 0b011000000): 8,
+    (0b000001110, 0b011000001): 8,
+    (0b000001110, 0b011010000): 8,
+    (0b000001110, 0b011100000): 8,
+    (0b000001110, 0b100000001): 4,
+    (0b000001110, 0b100010000): 0,
+    (0b000001110, 0b100100000): 0,
+    (0b000001110, 0b100100001): 4,
+    (0b000001110, 0b100110000): 0,
+    (0b000001110, 0b101000000): 7,
+    (0b000001110, 0b101000001): 4,
+    (0b000001110, 0b101010000): 0,
+    (0b000001110, 0b101100000): 7,
+    (0b000001110, 0b110000000): 6,
+    (0b000001110, 0b110000001): 4,
+    (0b000001110, 0b110010000): 0,
+    (0b000001110, 0b110100000): 6,
+    (0b000010000, 0b000000000): 0,
+    (0b000010000, 0b000000001): 2,
+    (0b000010000, 0b000000010): 0,
+    (0b000010001, 0b000000010): 8,
+    (0b000010001, 0b000000100): 8,
+    (0b000010001, 0b000000110): 8,
+    (0b000010001, 0b000001010): 8,
+    (0b000010001, 0b000001100): 8,
+    (0b000010001, 0b000100000): 8,
+    (0b000010001, 0b000100010): 8,
+    (0b000010001, 0b000100100): 8,
+    (0b000010001, 0b000101000): 8,
+    (0b000010001, 0b001000100): 8,
+    (0b000010001, 0b001100000): 8,
+    (0b000010001, 0b010100000): 8,
+    (0b000010001, 0b100000000): 2,
+    (0b000010001, 0b100000010): 2,
+    (0b000010001, 0b100000100): 5,
+    (0b000010001, 0b100100000): 2,
+    (0b000010010, 0b000000001): 7,
+    (0b000010010, 0b000000101): 7,
+    (0b000010010, 0b000001000): 7,
+    (0b000010010, 0b000001001): 6,
+    (0b000010010, 0b000001100): 7,
+    (0b000010010, 0b000101000): 7,
+    (0b000010010, 0b001000000): 7,
+    (0b000010010, 0b001000001): 3,
+    (0b000010010, 0b001000100): 7,
+    (0b000010010, 0b001001000): 0,
+    (0b000010010, 0b001100000): 7,
+    (0b000010010, 0b010000000): 0,
+    (0b000010010, 0b010000001): 6,
+    (0b000010010, 0b010001000): 6,
+    (0b000010010, 0b011000000): 8,
+    (0b000010010, 0b101000000): 7,
+    (0b000010011, 0b000001100): 6,
+    (0b000010011, 0b000100100): 8,
+    (0b000010011, 0b000101000): 2,
+    (0b000010011, 0b000101100): 8,
+    (0b000010011, 0b001000100): 8,
+    (0b000010011, 0b001001000): 2,
+    (0b000010011, 0b001001100): 8,
+    (0b000010011, 0b001100000): 2,
+    (0b000010011, 0b001100100): 8,
+    (0b000010011, 0b001101000): 2,
+    (0b000010011, 0b010000100): 8,
+    (0b000010011, 0b010001000): 2,
+    (0b000010011, 0b010001100): 8,
+    (0b000010011, 0b010100000): 2,
+    (0b000010011, 0b010100100): 8,
+    (0b000010011, 0b010101000): 2,
+    (0b000010011, 0b011000000): 8,
+    (0b000010011, 0b011000100): 8,
+    (0b000010011, 0b011001000): 8,
+    (0b000010011, 0b011100000): 8,
+    (0b000010011, 0b100000100): 5,
+    (0b000010011, 0b100001000): 2,
+    (0b000010011, 0b100001100): 5,
+    (0b000010011, 0b100100000): 2,
+    (0b000010011, 0b100101000): 2,
+    (0b000010011, 0b101000000): 7,
+    (0b000010011, 0b101000100): 5,
+    (0b000010011, 0b101001000): 7,
+    (0b000010011, 0b101100000): 2,
+    (0b000010011, 0b110000000): 6,
+    (0b000010011, 0b110000100): 6,
+    (0b000010011, 0b110001000): 6,
+    (0b000010011, 0b110100000): 2,
+    (0b000010101, 0b000001010): 6,
+    (0b000010101, 0b000101000): 6,
+    (0b000010101, 0b000101010): 6,
+    (0b000010101, 0b001000010): 8,
+    (0b000010101, 0b001001000): 8,
+    (0b000010101, 0b001001010): 8,
+    (0b000010101, 0b001100000): 8,
+    (0b000010101, 0b001100010): 8,
+    (0b000010101, 0b001101000): 8,
+    (0b000010101, 0b010000010): 6,
+    (0b000010101, 0b010001000): 6,
+    (0b000010101, 0b010001010): 6,
+    (0b000010101, 0b010101000): 6,
+    (0b000010101, 0b011000000): 8,
+    (0b000010101, 0b011000010): 8,
+    (0b000010101, 0b011001000): 8,
+    (0b000010101, 0b011100000): 8,
+    (0b000010101, 0b101000000): 7,
+    (0b000010101, 0b101000010): 7,
+    (0b000010101, 0b101001000): 7,
+    (0b000011010, 0b000000101): 6,
+    (0b000011010, 0b000100001): 7,
+    (0b000011010, 0b000100100): 8,
+    (0b000011010, 0b000100101): 8,
+    (0b000011010, 0b001000100): 0,
+    (0b000011010, 0b001000101): 8,
+    (0b000011010, 0b001100000): 7,
+    (0b000011010, 0b001100001): 7,
+    (0b000011010, 0b001100100): 8,
+    (0b000011010, 0b010100000): 8,
+    (0b000011010, 0b010100001): 8,
+    (0b000011010, 0b010100100): 8,
+    (0b000011010, 0b100000001): 2,
+    (0b000011010, 0b100000100): 5,
+    (0b000011010, 0b100000101): 5,
+    (0b000011010, 0b100100000): 2,
+    (0b000011010, 0b100100001): 2,
+    (0b000011010, 0b101000100): 5,
+    (0b000011010, 0b101100000): 2,
+    (0b000011010, 0b110100000): 2,
+    (0b000011011, 0b001100100): 8,
+    (0b000011011, 0b010100100): 8,
+    (0b000011011, 0b011100100): 8,
+    (0b000011011, 0b101000100): 5,
+    (0b000011011, 0b101100000): 2,
+    (0b000011011, 0b110100000): 2,
+    (0b000011100, 0b000000011): 6,
+    (0b000011100, 0b000100001): 6,
+    (0b000011100, 0b000100010): 6,
+    (0b000011100, 0b000100011): 6,
+    (0b000011100, 0b001000001): 5,
+    (0b000011100, 0b001000010): 5,
+    (0b000011100, 0b001000011): 5,
+    (0b000011100, 0b001100000): 0,
+    (0b000011100, 0b001100001): 8,
+    (0b000011100, 0b001100010): 0,
+    (0b000011100, 0b010000001): 6,
+    (0b000011100, 0b010000010): 0,
+    (0b000011100, 0b010000011): 6,
+    (0b000011100, 0b010100000): 6,
+    (0b000011100, 0b010100001): 6,
+    (0b000011100, 0b010100010): 6,
+    (0b000011100, 0b011000000): 8,
+    (0b000011100, 0b011000001): 8,
+    (0b000011100, 0b011000010): 8,
+    (0b000011100, 0b011100000): 8,
+    (0b000011100, 0b100000001): 6,
+    (0b000011100, 0b100000010): 0,
+    (0b000011100, 0b100000011): 6,
+    (0b000011100, 0b100100000): 6,
+    (0b000011100, 0b100100001): 6,
+    (0b000011100, 0b100100010): 6,
+    (0b000011100, 0b101000000): 7,
+    (0b000011100, 0b101000001): 7,
+    (0b000011100, 0b101000010): 7,
+    (0b000011100, 0b101100000): 7,
+    (0b000011100, 0b110000000): 6,
+    (0b000011100, 0b110000001): 6,
+    (0b000011100, 0b110000010): 6,
+    (0b000011100, 0b110100000): 6,
+    (0b000011101, 0b001100010): 8,
+    (0b000011101, 0b010100010): 6,
+    (0b000011101, 0b011000010): 8,
+    (0b000011101, 0b011100000): 8,
+    (0b000011101, 0b011100010): 8,
+    (0b000011101, 0b100100010): 6,
+    (0b000011101, 0b101000010): 7,
+    (0b000011101, 0b101100000): 7,
+    (0b000011101, 0b101100010): 7,
+    (0b000011101, 0b110000010): 6,
+    (0b000011101, 0b110100000): 6,
+    (0b000011101, 0b110100010): 6,
+    (0b000011110, 0b001100001): 7,
+    (0b000011110, 0b010100001): 6,
+    (0b000011110, 0b011000001): 8,
+    (0b000011110, 0b011100000): 8,
+    (0b000011110, 0b011100001): 8,
+    (0b000011110, 0b100100001): 6,
+    (0b000011110, 0b101000001): 7,
+    (0b000011110, 0b101100000): 7,
+    (0b000011110, 0b101100001): 7,
+    (0b000011110, 0b110000001): 6,
+    (0b000011110, 0b110100000): 6,
+    (0b000011110, 0b110100001): 6,
+    (0b000101000, 0b000000001): 4,
+    (0b000101000, 0b000000010): 4,
+    (0b000101000, 0b000000011): 2,
+    (0b000101000, 0b000000101): 1,
+    (0b000101000, 0b000010000): 0,
+    (0b000101000, 0b000010001): 8,
+    (0b000101000, 0b000010010): 7,
+    (0b000101000, 0b001000001): 4,
+    (0b000101000, 0b001000010): 4,
+    (0b000101000, 0b001000100): 4,
+    (0b000101000, 0b010000010): 4,
+    (0b000101001, 0b000000110): 4,
+    (0b000101001, 0b000010010): 7,
+    (0b000101001, 0b000010100): 6,
+    (0b000101001, 0b000010110): 6,
+    (0b000101001, 0b001000010): 4,
+    (0b000101001, 0b001000100): 4,
+    (0b000101001, 0b001000110): 4,
+    (0b000101001, 0b001010000): 2,
+    (0b000101001, 0b001010010): 2,
+    (0b000101001, 0b010000010): 4,
+    (0b000101001, 0b010000100): 4,
+    (0b000101001, 0b010000110): 4,
+    (0b000101001, 0b010010000): 1,
+    (0b000101001, 0b010010100): 6,
+    (0b000101001, 0b011000000): 8,
+    (0b000101001, 0b011000010): 4,
+    (0b000101001, 0b011000100): 4,
+    (0b000101001, 0b011010000): 2,
+    (0b000101001, 0b100000010): 4,
+    (0b000101001, 0b100000100): 4,
+    (0b000101001, 0b100000110): 4,
+    (0b000101001, 0b100010000): 6,
+    (0b000101001, 0b100010010): 7,
+    (0b000101001, 0b100010100): 6,
+    (0b000101001, 0b101000000): 7,
+    (0b000101001, 0b101000010): 7,
+    (0b000101001, 0b101000100): 4,
+    (0b000101001, 0b101010000): 2,
+    (0b000101001, 0b110000000): 6,
+    (0b000101001, 0b110000010): 4,
+    (0b000101001, 0b110000100): 6,
+    (0b000101001, 0b110010000): 6,
+    (0b000101010, 0b000000101): 4,
+    (0b000101010, 0b000010001): 8,
+    (0b000101010, 0b000010101): 6,
+    (0b000101010, 0b001000001): 4,
+    (0b000101010, 0b001000100): 4,
+    (0b000101010, 0b001000101): 4,
+    (0b000101010, 0b001010000): 2,
+    (0b000101010, 0b001010001): 2,
+    (0b000101010, 0b010000001): 4,
+    (0b000101010, 0b010000101): 4,
+    (0b000101010, 0b010010000): 6,
+    (0b000101010, 0b010010001): 8,
+    (0b000101010, 0b011000000): 8,
+    (0b000101010, 0b011000001): 8,
+    (0b000101010, 0b011000100): 4,
+    (0b000101010, 0b011010000): 2,
+    (0b000101010, 0b101000000): 7,
+    (0b000101010, 0b101000001): 4,
+    (0b000101010, 0b101010000): 0,
+    (0b000101011, 0b010010100): 6,
+    (0b000101011, 0b011000100): 4,
+    (0b000101011, 0b011010000): 2,
+    (0b000101011, 0b100010100): 6,
+    (0b000101011, 0b101000100): 4,
+    (0b000101011, 0b101010000): 2,
+    (0b000101011, 0b110000100): 6,
+    (0b000101011, 0b110010000): 6,
+    (0b000101011, 0b110010100): 6,
+    (0b000101101, 0b001010010): 7,
+    (0b000101101, 0b011000010): 4,
+    (0b000101101, 0b011010000): 8,
+    (0b000101101, 0b101000010): 7,
+    (0b000101101, 0b101010000): 7,
+    (0b000101101, 0b101010010): 7,
+    (0b001000100, 0b000000001): 4,
+    (0b001000100, 0b000000010): 4,
+    (0b001000100, 0b000000011): 4,
+    (0b001000100, 0b000001010): 4,
+    (0b001000100, 0b000010000): 1,
+    (0b001000100, 0b000010001): 8,
+    (0b001000100, 0b000010010): 7,
+    (0b001000100, 0b000100001): 4,
+    (0b001000100, 0b000100010): 4,
+    (0b001000100, 0b000101000): 4,
+    (0b001000100, 0b100000001): 4,
+    (0b001000101, 0b000001010): 4,
+    (0b001000101, 0b000010010): 7,
+    (0b001000101, 0b000011010): 5,
+    (0b001000101, 0b000100010): 4,
+    (0b001000101, 0b000101000): 4,
+    (0b001000101, 0b000101010): 4,
+    (0b001000101, 0b000110000): 3,
+    (0b001000101, 0b000110010): 3,
+    (0b001000101, 0b010100000): 4,
+    (0b001000101, 0b010100010): 4,
+    (0b001000101, 0b010110000): 1,
+    (0b001000101, 0b100000010): 4,
+    (0b001000101, 0b100001010): 4,
+    (0b001000101, 0b100010000): 1,
+    (0b001000101, 0b100010010): 7,
+    (0b001000101, 0b100100000): 4,
+    (0b001000101, 0b100100010): 4,
+    (0b001000101, 0b100101000): 4,
+    (0b001000101, 0b100110000): 3,
+    (0b001000101, 0b110100000): 4,
+    (0b001000110, 0b000001001): 4,
+    (0b001000110, 0b000010001): 8,
+    (0b001000110, 0b000011000): 5,
+    (0b001000110, 0b000011001): 8,
+    (0b001000110, 0b000100001): 4,
+    (0b001000110, 0b000101000): 4,
+    (0b001000110, 0b000101001): 4,
+    (0b001000110, 0b000110000): 3,
+    (0b001000110, 0b000110001): 8,
+    (0b001000110, 0b010000001): 4,
+    (0b001000110, 0b010001000): 4,
+    (0b001000110, 0b010001001): 4,
+    (0b001000110, 0b010010000): 0,
+    (0b001000110, 0b010010001): 8,
+    (0b001000110, 0b010011000): 5,
+    (0b001000110, 0b010100000): 4,
+    (0b001000110, 0b010100001): 4,
+    (0b001000110, 0b010101000): 4,
+    (0b001000110, 0b010110000): 3,
+    (0b001000110, 0b100000001): 4,
+    (0b001000110, 0b100001000): 4,
+    (0b001000110, 0b100001001): 4,
+    (0b001000110, 0b100010000): 0,
+    (0b001000110, 0b100011000): 0,
+    (0b001000110, 0b100100000): 4,
+    (0b001000110, 0b100100001): 4,
+    (0b001000110, 0b100101000): 4,
+    (0b001000110, 0b100110000): 0,
+    (0b001000110, 0b110000000): 4,
+    (0b001000110, 0b110000001): 4,
+    (0b001000110, 0b110001000): 4,
+    (0b001000110, 0b110010000): 0,
+    (0b001000110, 0b110100000): 4,
+    (0b001001110, 0b000110001): 8,
+    (0b001001110, 0b010100001): 4,
+    (0b001001110, 0b010110000): 0,
+    (0b001001110, 0b010110001): 8,
+    (0b001001110, 0b100100001): 4,
+    (0b001001110, 0b100110000): 0,
+    (0b001001110, 0b110100000): 4,
+    (0b001001110, 0b110100001): 4,
+    (0b001001110, 0b110110000): 0,
+    (0b001100001, 0b000000110): 3,
+    (0b001100001, 0b000001010): 4,
+    (0b001100001, 0b000001100): 4,
+    (0b001100001, 0b000001110): 4,
+    (0b001100001, 0b000010010): 7,
+    (0b001100001, 0b000010100): 3,
+    (0b001100001, 0b000010110): 7,
+    (0b001100001, 0b000011000): 2,
+    (0b001100001, 0b000011010): 7,
+    (0b001100001, 0b000011100): 8,
+    (0b001100001, 0b010000010): 4,
+    (0b001100001, 0b010000100): 3,
+    (0b001100001, 0b010000110): 4,
+    (0b001100001, 0b010001010): 4,
+    (0b001100001, 0b010001100): 4,
+    (0b001100001, 0b010010100): 1,
+    (0b001100001, 0b100000100): 3,
+    (0b001100001, 0b100000110): 3,
+    (0b001100001, 0b100001100): 4,
+    (0b001100001, 0b100010100): 3,
+    (0b001100010, 0b000000101): 4,
+    (0b001100010, 0b000001001): 4,
+    (0b001100010, 0b000001100): 4,
+    (0b001100010, 0b000001101): 4,
+    (0b001100010, 0b000010001): 8,
+    (0b001100010, 0b000010100): 0,
+    (0b001100010, 0b000010101): 8,
+    (0b001100010, 0b000011000): 2,
+    (0b001100010, 0b000011001): 8,
+    (0b001100010, 0b000011100): 0,
+    (0b001100010, 0b010000001): 4,
+    (0b001100010, 0b010000101): 4,
+    (0b001100010, 0b010001000): 2,
+    (0b001100010, 0b010001001): 4,
+    (0b001100010, 0b010001100): 4,
+    (0b001100010, 0b010010001): 8,
+    (0b001100010, 0b010011000): 0,
+    (0b001100010, 0b100000001): 4,
+    (0b001100010, 0b100000101): 4,
+    (0b001100010, 0b100001001): 4,
+    (0b001100011, 0b000011100): 8,
+    (0b001100011, 0b010001100): 4,
+    (0b001100011, 0b010010100): 3,
+    (0b001100011, 0b010011000): 2,
+    (0b001100011, 0b010011100): 8,
+    (0b001100011, 0b100001100): 4,
+    (0b001100011, 0b100010100): 3,
+    (0b001100011, 0b100011000): 2,
+    (0b001100011, 0b100011100): 7,
+    (0b001100011, 0b110000100): 3,
+    (0b001100011, 0b110001000): 2,
+    (0b001100011, 0b110001100): 4,
+    (0b001100011, 0b110010000): 2,
+    (0b001100011, 0b110010100): 3,
+    (0b001100011, 0b110011000): 2,
+    (0b001100101, 0b000011010): 7,
+    (0b001100101, 0b010001010): 4,
+    (0b001100101, 0b010011000): 1,
+    (0b001100101, 0b100001010): 4,
+    (0b001100101, 0b100010010): 7,
+    (0b001100101, 0b100011000): 1,
+    (0b001100101, 0b100011010): 7,
+    (0b001100101, 0b110000010): 4,
+    (0b001100101, 0b110001000): 4,
+    (0b001100101, 0b110001010): 4,
+    (0b001100101, 0b110010000): 1,
+    (0b001100101, 0b110011000): 1,
+    (0b001100110, 0b000011001): 8,
+    (0b001100110, 0b010001001): 4,
+    (0b001100110, 0b010010001): 8,
+    (0b001100110, 0b010011000): 0,
+    (0b001100110, 0b010011001): 8,
+    (0b001100110, 0b100001001): 4,
+    (0b001100110, 0b110001001): 4,
+    (0b001101010, 0b000010101): 8,
+    (0b001101010, 0b010000101): 4,
+    (0b001101010, 0b010010001): 8,
+    (0b001101010, 0b010010100): 0,
+    (0b001101010, 0b010010101): 8,
+    (0b001101010, 0b100000101): 4,
+    (0b001101010, 0b100010100): 0,
+    (0b001101010, 0b110000001): 4,
+    (0b001101010, 0b110000100): 4,
+    (0b001101010, 0b110000101): 4,
+    (0b001101010, 0b110010000): 0,
+    (0b001101010, 0b110010100): 0,
+    (0b001101100, 0b000010011): 8,
+    (0b001101100, 0b010000011): 4,
+    (0b001101100, 0b010010001): 8,
+    (0b001101100, 0b100000011): 4,
+    (0b001101100, 0b110000011): 4,
+    (0b001110001, 0b000001110): 8,
+    (0b001110001, 0b010000110): 8,
+    (0b001110001, 0b010001010): 2,
+    (0b001110001, 0b010001100): 8,
+    (0b001110001, 0b010001110): 8,
+    (0b001110001, 0b100000110): 3,
+    (0b001110001, 0b100001100): 1,
+    (0b001110001, 0b100001110): 7,
+    (0b001110001, 0b110000110): 3,
+    (0b001110010, 0b000001101): 7,
+    (0b001110010, 0b010000101): 3,
+    (0b001110010, 0b010001001): 2,
+    (0b001110010, 0b010001100): 0,
+    (0b001110010, 0b010001101): 8,
+    (0b001110010, 0b100000101): 3,
+    (0b001110010, 0b100001001): 2,
+    (0b001110010, 0b100001101): 7,
+    (0b001110010, 0b110001001): 2,
+    (0b010101010, 0b000010101): 6,
+    (0b010101010, 0b001000101): 4,
+    (0b010101010, 0b101000101): 4,
+    (0b101000101, 0b000011010): 5,
+    (0b101000101, 0b000101010): 4,
+    (0b101000101, 0b010101010): 4,
+}
@@ -2,13 +2,40 @@
 
 import pygame as pg
 import random
-import math
 import time
 from enum import Enum
 from argparse import ArgumentParser
 
+# without a usable opening book every move is searched,
+# which also lets generate_opening_book.py rebuild a missing or broken one
+try:
+    from opening_book import OPENING_BOOK
+except (ImportError, SyntaxError):
+    OPENING_BOOK = {}
+
 HEIGHT = WIDTH = 700
-FPS = 24
+# colors as rgb tuples, so pygame does not have to look up color names
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+# longest time in ms the main loop sleeps while waiting for input
+IDLE_TIMEOUT = 1000
+
+# board geometry, indexed by cell row * 3 + col
+CIRCLE_SIZE = WIDTH / 8
+CROSS_OFFSET = WIDTH / 12
+CELL_CENTERS = tuple(
+    ((WIDTH * col / 3) + WIDTH / 6, (HEIGHT * row / 3) + HEIGHT / 6)
+    for row in range(3) for col in range(3)
+)
+CROSS_LINES = tuple(
+    (
+        ((WIDTH * col / 3 + CROSS_OFFSET, HEIGHT * row / 3 + CROSS_OFFSET),
+         (WIDTH * col / 3 + CROSS_OFFSET * 3, HEIGHT * row / 3 + CROSS_OFFSET * 3)),
+        ((WIDTH * col / 3 + CROSS_OFFSET, HEIGHT * row / 3 + CROSS_OFFSET * 3),
+         (WIDTH * col / 3 + CROSS_OFFSET * 3, HEIGHT * row / 3 + CROSS_OFFSET)),
+    )
+    for row in range(3) for col in range(3)
+)
 
 class Mode(Enum):
     RANDOM = 0
@@ -53,17 +80,82 @@ class Result():
     COMPUTER_WON = 1
 
 
-EMPTY = ""
-PLAYER = "X"
-COMPUTER = "O"
+# kind of score stored in the transposition table
+class Bound():
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+# the board is stored as two 9 bit masks, one for each player,
+# cell (row, col) is bit row * 3 + col
+FULL_BOARD = 0b111_111_111
+WIN_LINES = (
+    0o007, 0o070, 0o700, # rows
+    0o111, 0o222, 0o444, # columns
+    0o421, 0o124,        # diagonals
+)
+# a win scores WIN_SCORE minus the number of pieces on the board, so
+# quicker wins and slower losses are preferred
+WIN_SCORE = 10
+INFINITY = 10_000
+# the win lines passing through each cell
+LINES_THROUGH = tuple(
+    tuple(line for line in WIN_LINES if (line >> cell) & 1) for cell in range(9)
+)
+# order in which moves are searched: center, corners, edges
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+# the empty cells in MOVE_ORDER for each of the 512 masks of occupied cells
+MOVES_FOR_OCCUPIED = tuple(
+    tuple(move for move in MOVE_ORDER if not (occupied >> move) & 1)
+    for occupied in range(512)
+)
+
+# the 4 rotations and 4 reflections of the board as cell index permutations
+SYMMETRIES = tuple(
+    tuple(symmetry(i // 3, i % 3) for i in range(9))
+    for symmetry in (
+        lambda row, col: row * 3 + col,
+        lambda row, col: col * 3 + 2 - row,
+        lambda row, col: (2 - row) * 3 + 2 - col,
+        lambda row, col: (2 - col) * 3 + row,
+        lambda row, col: row * 3 + 2 - col,
+        lambda row, col: (2 - row) * 3 + col,
+        lambda row, col: col * 3 + row,
+        lambda row, col: (2 - col) * 3 + 2 - row,
+    )
+)
+# for every symmetry, maps each of the 512 masks to its transformed mask
+SYMMETRY_TABLES = tuple(
+    tuple(sum(1 << cells[i] for i in range(9) if (mask >> i) & 1) for mask in range(512))
+    for cells in SYMMETRIES
+)
+
+# slots of a search stack frame which change while its moves are searched,
+# alpha-beta frames also hold the current and the original search window
+FRAME_BEST = 6
+FRAME_ALPHA = 7
+FRAME_BETA = 8
 
 
 class TicTacToe:
     def __init__(self, mode, state):
-        self.board = self.get_empty_board()
+        self.p_mask, self.c_mask = self.get_empty_board()
         self.result = None
         self.mode = Mode(mode)
         self.starting_player = State(state)
+        # transposition table, maps searched positions to their score
+        self._tt = {}
+        # scoring function of the selected mode, None for random moves
+        self._strategy = {
+            Mode.MINIMAX: lambda d, p, c, m: minimax_search(self._tt, d, p, c, False, m),
+            Mode.MINIMAX_AB: lambda d, p, c, m: alpha_beta_search(self._tt, d, -INFINITY, INFINITY, p, c, False, m),
+            Mode.NEGAMAX: lambda d, p, c, m: -negamax_search(self._tt, d, p, c, -1, m),
+        }.get(self.mode)
+        # board background and end screen texts, drawn on first use
+        self._grid_surface = None
+        self._end_texts = None
+        self._text_klick = None
 
     def runGame(self):
         pg.init()
@@ -71,39 +163,58 @@ class TicTacToe:
         # draw window screen
         screen = pg.display.set_mode((WIDTH, HEIGHT))
         pg.display.set_caption("Tic Tac Toe")
-        clock = pg.time.Clock()
         updateDelay = 0
 
         # starting player
         state = self.starting_player
-        
+
+        # the screen is only redrawn when something changed
+        dirty = True
+        end_screen = False
+
         # main loop
         running = True
         while running:
-            # Clear event queue at the start of each frame
-            for event in pg.event.get():
+            # sleep until there is input, unless the computer has to move,
+            # the screen has to be redrawn or the end screen is due
+            if state == State.COMPUTERS_TURN or dirty:
+                events = pg.event.get()
+            else:
+                timeout = IDLE_TIMEOUT
+                if state == State.GAME_OVER and not end_screen:
+                    timeout = max(1, int((updateDelay - time.time()) * 1000))
+                events = [pg.event.wait(timeout)] + pg.event.get()
+
+            for event in events:
                 if event.type == pg.QUIT:
                     running = False
-                
+
+                # window content got lost, e.g. after being covered
+                if event.type in (pg.VIDEOEXPOSE, pg.WINDOWEXPOSED):
+                    dirty = True
+
                 # Handle mouse clicks in appropriate states
                 if event.type == pg.MOUSEBUTTONDOWN:
                     if state == State.PLAYERS_TURN:
-                        # find coordinates from the box that got clicked
-                        box_coordinates = self.calculate_box(pg.mouse.get_pos())
+                        # find the box that got clicked
+                        move = self.calculate_box(pg.mouse.get_pos())
                         # check if box is empty and set cross
-                        if self.board[box_coordinates[0]][box_coordinates[1]] == EMPTY:
-                            self.board[box_coordinates[0]][box_coordinates[1]] = PLAYER
+                        if not ((self.p_mask | self.c_mask) >> move) & 1:
+                            self.p_mask |= 1 << move
+                            dirty = True
                             # switch to computers turn
                             state = State.COMPUTERS_TURN
                             # check if game has ended
-                            result = self.check_game_result(self.board)
+                            result = check_move_result(self.p_mask, self.c_mask, move)
                             if result is not None:
                                 self.result = result
                                 state = State.GAME_OVER
                             updateDelay = time.time() + 0.7
                     elif state == State.GAME_OVER:
                         # game starts again so reset board
-                        self.board = self.get_empty_board()
+                        self.p_mask, self.c_mask = self.get_empty_board()
+                        self._tt.clear()
+                        dirty = True
                         # switching player
                         if self.starting_player == State.PLAYERS_TURN:
                             self.starting_player = State.COMPUTERS_TURN
@@ -114,260 +225,366 @@ class TicTacToe:
 
             # State-specific updates (outside of event handling)
             if state == State.COMPUTERS_TURN:
-                self.computer_makes_a_move()
+                move = self.computer_makes_a_move()
+                dirty = True
                 # players move again
                 state = State.PLAYERS_TURN
                 # check if game has ended
-                result = self.check_game_result(self.board)
+                result = check_move_result(self.p_mask, self.c_mask, move)
                 if result is not None:
                     self.result = result
                     state = State.GAME_OVER
                 updateDelay = time.time() + 0.5
 
             # Game over state handling
-            if state == State.GAME_OVER and time.time() > updateDelay:
-                self.draw_end_screen(screen)
-            else:
-                self.draw_board(screen)
-
-            pg.display.flip()
-            clock.tick(FPS)
+            if end_screen != (state == State.GAME_OVER and time.time() > updateDelay):
+                end_screen = not end_screen
+                dirty = True
+
+            if dirty:
+                if end_screen:
+                    self.draw_end_screen(screen)
+                else:
+                    self.draw_board(screen)
+                pg.display.flip()
+                dirty = False
 
         # Properly quit pygame when the loop ends
         pg.quit()
 
 
-    # calculate box coordinates from screen coordinates
-    # (x,y) -> (row, col)
+    # calculate box index from screen coordinates
+    # (x,y) -> row * 3 + col
     def calculate_box(self, position):
-        return (int(position[1] // (WIDTH / 3)), int(position[0] // (HEIGHT / 3)))
+        return int(position[1] // (WIDTH / 3)) * 3 + int(position[0] // (HEIGHT / 3))
 
-    # computers move based on the selected game mode
+    # computers move based on the selected game mode, returns the move
     def computer_makes_a_move(self):
         if self.mode == Mode.RANDOM:
-            self.random_move()
+            return self.random_move()
         else:
-            self.best_move()
+            return self.best_move()
 
-    # computer does a random move
+    # computer does a random move and returns it
     def random_move(self):
-        while True:
-            x = random.randint(0, 2)
-            y = random.randint(0, 2)
-            # if the cell is empty, make the move and exit the loop
-            if self.board[x][y] == EMPTY:
-                self.board[x][y] = COMPUTER
-                return
-
-    # computer does move according to the minimax/negamax algorithm
+        # pick one of the empty cells
+        move = random.choice(possible_moves(self.p_mask, self.c_mask))
+        self.c_mask |= 1 << move
+        return move
+
+    # computer does the best move according to the minimax/negamax algorithm
+    # and returns it, minimax-ab looks it up in the opening book and only
+    # searches positions missing from it
     def best_move(self):
-        best_score = -math.inf
-        best_move = (0, 0)
+        move = None
+        if self.mode == Mode.MINIMAX_AB:
+            # the book only holds canonical positions, so the move is looked up
+            # for the canonical version of the board and then mapped back
+            symmetry = canonical_symmetry(self.p_mask, self.c_mask)
+            table = SYMMETRY_TABLES[symmetry]
+            move = OPENING_BOOK.get((table[self.p_mask], table[self.c_mask]))
+            if move is not None:
+                move = SYMMETRIES[symmetry].index(move)
+        if move is None:
+            move = self.search_move()
 
-        # select the scoring function based on current mode
-        strategies = {
-            Mode.MINIMAX: lambda b: self.minimax_search(1, b, False),
-            Mode.MINIMAX_AB: lambda b: self.alpha_beta_search(1, -math.inf, math.inf, b, False),
-            Mode.NEGAMAX: lambda b: -self.negamax_search(1, b, -1),
-        }
-        strategy = strategies.get(self.mode)
+        # apply the best move
+        self.c_mask |= 1 << move
+        return move
 
-        # deep copy board
-        board = [row[:] for row in self.board]
+    # returns the best move for the computer found by the selected search
+    def search_move(self):
+        best_score = -INFINITY
+        best_move = 0
+
+        # depth counts the pieces on the board, so a position always gets
+        # the same score and can be shared in the transposition table
+        depth = bin(self.p_mask | self.c_mask).count("1") + 1
 
         # evaluate all possible moves and find the best one
-        # using negamax search to determine optimal play
-        for (row, col) in self.possible_moves(board):
-            board[row][col] = COMPUTER # simulate move
-            score = strategy(board)    # evaluate the move
-            board[row][col] = EMPTY    # undo the move
+        # the masks are plain ints, so every move is simulated on a copy
+        for move in possible_moves(self.p_mask, self.c_mask):
+            score = self._strategy(depth, self.p_mask, self.c_mask | (1 << move), move)
             # update best move if this one scores higher
             if score > best_score:
                 best_score = score
-                best_move = (row, col)
+                best_move = move
 
-        # apply the best move
-        self.board[best_move[0]][best_move[1]] = COMPUTER
+        return best_move
 
-    def minimax_search(self, depth, board, is_maximizing):
+    def draw_board(self, screen):
+        # background and tictactoe-field only have to be drawn once
+        if self._grid_surface is None:
+            self._grid_surface = pg.Surface((WIDTH, HEIGHT))
+            self._grid_surface.fill(WHITE)
+            for i in range(1, 3):
+                pg.draw.line(self._grid_surface, BLACK, (WIDTH * i / 3, 0), (WIDTH * i / 3, HEIGHT))
+                pg.draw.line(self._grid_surface, BLACK, (0, HEIGHT * i / 3), (WIDTH, HEIGHT * i / 3))
+        screen.blit(self._grid_surface, (0, 0))
+
+        # draw crosses and circles
+        for box in range(9):
+            if (self.c_mask >> box) & 1:
+                # draw circle
+                pg.draw.circle(screen, BLACK, CELL_CENTERS[box], CIRCLE_SIZE)
+                pg.draw.circle(screen, WHITE, CELL_CENTERS[box], CIRCLE_SIZE - 1)
+            elif (self.p_mask >> box) & 1:
+                # draw cross
+                for start, end in CROSS_LINES[box]:
+                    pg.draw.line(screen, BLACK, start, end)
+
+    def draw_end_screen(self, screen):
+        # fonts and texts only have to be rendered once
+        if self._end_texts is None:
+            font = pg.font.Font(None, 100)
+            font_small = pg.font.Font(None, 40)
+            text_type = ["You Won!", "It's a Tie!", "You Lost!"]
+            self._end_texts = [font.render(t, True, BLACK) for t in text_type]
+            self._text_klick = font_small.render("Click anywhere to start again", True, BLACK)
+
+        # texts
+        text = self._end_texts[self.result + 1]
+        text_klick = self._text_klick
+
+        # draw screen and texts
+        screen.fill(WHITE)
+        screen.blit(
+            text,
+            (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - text.get_height() * 3),
+        )
+        screen.blit(
+            text_klick,
+            (WIDTH // 2 - text.get_width() * 0.6, HEIGHT // 2 - text.get_height()),
+        )
+
+    # reset board, returns the (player, computer) masks
+    def get_empty_board(self):
+        return 0, 0
+        # return 0b011_100_000, 0b100_001_100 # position from infographic
+
+
+# the search functions only work on the two masks and a transposition
+# table, so they do not depend on the game or pygame.
+# they walk the game tree with an explicit stack instead of recursion,
+# every frame is a list holding the position's key, depth, masks, side
+# to move, the iterator over its remaining moves and the best score so far
+
+def minimax_search(tt, depth, p_mask, c_mask, is_maximizing, last_move):
+    stack = []
+    while True:
         # if game is finished stop search and return result
-        result = self.check_game_result(board)
+        result = check_move_result(p_mask, c_mask, last_move)
         if result is not None:
             # there is a win, loss or tie
-            return result / depth
+            score = result * (WIN_SCORE - depth)
+        else:
+            # position was already searched
+            key = canonical(p_mask, c_mask) << 1 | is_maximizing
+            score = tt.get(key)
+            if score is None:
+                # search the moves of this position next
+                moves = iter(possible_moves(p_mask, c_mask))
+                best = -INFINITY if is_maximizing else INFINITY
+                stack.append([key, depth, p_mask, c_mask, is_maximizing, moves, best])
+
+        # hand the score to the parent until a position has moves left
+        while stack:
+            frame = stack[-1]
+            key, depth, p_mask, c_mask, is_maximizing, moves, best = frame
+            if score is not None:
+                # if max players turn
+                if is_maximizing:
+                    frame[FRAME_BEST] = best = max(best, score)
+                # else min players turn
+                else:
+                    frame[FRAME_BEST] = best = min(best, score)
+            move = next(moves, None)
+            if move is not None:
+                break
+            stack.pop()
+            tt[key] = score = best
+        else:
+            return score
 
-        # if max players turn
+        # descend into the next move
         if is_maximizing:
-            max_score = -math.inf
-            for move in self.possible_moves(board):
-                board[move[0]][move[1]] = COMPUTER
-                score = self.minimax_search(depth + 1, board, False)
-                board[move[0]][move[1]] = EMPTY
-                max_score = max(max_score, score)
-            return max_score
-        # else min players turn
+            c_mask |= 1 << move
         else:
-            min_score = math.inf
-            for move in self.possible_moves(board):
-                board[move[0]][move[1]] = PLAYER
-                score = self.minimax_search(depth + 1, board, True)
-                board[move[0]][move[1]] = EMPTY
-                min_score = min(min_score, score)
-            return min_score
-
-    def alpha_beta_search(self, depth, alpha, beta, board, is_maximizing):
+            p_mask |= 1 << move
+        last_move = move
+        depth += 1
+        is_maximizing = not is_maximizing
+
+
+def alpha_beta_search(tt, depth, alpha, beta, p_mask, c_mask, is_maximizing, last_move):
+    stack = []
+    while True:
         # if game is finished stop search and return result
-        result = self.check_game_result(board)
+        result = check_move_result(p_mask, c_mask, last_move)
         if result is not None:
             # there is a win, loss or tie
-            return result / depth
-
-        # if max players turn
-        if is_maximizing:
-            max_score = -math.inf
-            for move in self.possible_moves(board):
-                board[move[0]][move[1]] = COMPUTER
-                score = self.alpha_beta_search(depth + 1, alpha, beta, board, False)
-                board[move[0]][move[1]] = EMPTY
-                max_score = max(max_score, score)
-                alpha = max(alpha, score)
-                if beta <= alpha:
-                    break
-            return max_score
-        # else min players turn
+            score = result * (WIN_SCORE - depth)
         else:
-            min_score = math.inf
-            for move in self.possible_moves(board):
-                board[move[0]][move[1]] = PLAYER
-                score = self.alpha_beta_search(depth + 1, alpha, beta, board, True)
-                board[move[0]][move[1]] = EMPTY
-                min_score = min(min_score, score)
-                beta = min(beta, score)
+            # use what is known about the position to narrow the window
+            key = canonical(p_mask, c_mask) << 1 | is_maximizing
+            entry = tt.get(key)
+            score = None
+            if entry is not None:
+                bound, value = entry
+                if bound == Bound.EXACT:
+                    score = value
+                elif bound == Bound.LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
                 if beta <= alpha:
+                    score = value
+            if score is None:
+                # search the moves of this position next, the frame also
+                # holds the current and the original search window
+                moves = iter(possible_moves(p_mask, c_mask))
+                best = -INFINITY if is_maximizing else INFINITY
+                stack.append([key, depth, p_mask, c_mask, is_maximizing, moves, best, alpha, beta, alpha, beta])
+
+        # hand the score to the parent until a position has moves left
+        while stack:
+            frame = stack[-1]
+            key, depth, p_mask, c_mask, is_maximizing, moves, best, alpha, beta, low, high = frame
+            if score is not None:
+                # if max players turn
+                if is_maximizing:
+                    frame[FRAME_BEST] = best = max(best, score)
+                    frame[FRAME_ALPHA] = alpha = max(alpha, score)
+                # else min players turn
+                else:
+                    frame[FRAME_BEST] = best = min(best, score)
+                    frame[FRAME_BETA] = beta = min(beta, score)
+            if beta > alpha:
+                move = next(moves, None)
+                if move is not None:
                     break
-            return min_score
+            stack.pop()
+            score = best
+            # a score outside the searched window is only a bound
+            if score <= low:
+                tt[key] = (Bound.UPPER, score)
+            elif score >= high:
+                tt[key] = (Bound.LOWER, score)
+            else:
+                tt[key] = (Bound.EXACT, score)
+        else:
+            return score
+
+        # descend into the next move
+        if is_maximizing:
+            c_mask |= 1 << move
+        else:
+            p_mask |= 1 << move
+        last_move = move
+        depth += 1
+        is_maximizing = not is_maximizing
+
 
-    def negamax_search(self, depth, board, color):
+def negamax_search(tt, depth, p_mask, c_mask, color, last_move):
+    stack = []
+    while True:
         # if game is finished stop search and return result
-        result = self.check_game_result(board)
+        result = check_move_result(p_mask, c_mask, last_move)
         if result is not None:
             # there is a win, loss or tie
-            return (result * color) / depth
+            score = result * color * (WIN_SCORE - depth)
+        else:
+            # position was already searched
+            key = canonical(p_mask, c_mask) << 1 | (color == 1)
+            score = tt.get(key)
+            if score is None:
+                # search the moves of this position next
+                moves = iter(possible_moves(p_mask, c_mask))
+                stack.append([key, depth, p_mask, c_mask, color, moves, -INFINITY])
+
+        # hand the score to the parent until a position has moves left
+        while stack:
+            frame = stack[-1]
+            key, depth, p_mask, c_mask, color, moves, best = frame
+            if score is not None:
+                frame[FRAME_BEST] = best = max(best, -score)
+            move = next(moves, None)
+            if move is not None:
+                break
+            stack.pop()
+            tt[key] = score = best
+        else:
+            return score
 
-        max_score = -math.inf
-        for move in self.possible_moves(board):
-            if color == 1:
-                board[move[0]][move[1]] = COMPUTER
-            else:
-                board[move[0]][move[1]] = PLAYER
-            score = -self.negamax_search(depth + 1, board, -color)
-            max_score = max(max_score, score)
-            board[move[0]][move[1]] = EMPTY
-        return max_score
-
-    # returns all possible moves
-    def possible_moves(self, board):
-        return [
-            (row, col) for row in range(3) for col in range(3) if board[row][col] == EMPTY
-        ]
-        
-
-    # checks if game ends by a tie, win or loss
-    def check_game_result(self, board):
-        # diagonal strings
-        diagonal_left = "".join(board[i][i] for i in range(3))
-        diagonal_right = "".join(board[i][2 - i] for i in range(3))
-        # row and columns
-        for i in range(3):
-            row_values = "".join(board[i])
-            col_values = "".join(board[r][i] for r in range(3))
-            if PLAYER*3 in (row_values, col_values, diagonal_left, diagonal_right):
-                # player won
-                return Result.PLAYER_WON
-            elif COMPUTER*3 in (row_values, col_values, diagonal_left, diagonal_right):
-                # computer won
-                return Result.COMPUTER_WON
-
-        # check if board is full (tie)
-        if not any(EMPTY in row for row in board):
-            return Result.TIE
-
-        # Game still running
-        return None
+        # descend into the next move
+        if color == 1:
+            c_mask |= 1 << move
+        else:
+            p_mask |= 1 << move
+        last_move = move
+        depth += 1
+        color = -color
 
 
-    def draw_board(self, screen):
-        # fill background and draw tictactoe-field
-        screen.fill("white")
-        for i in range(1, 3):
-            pg.draw.line(screen, "black", (WIDTH * i / 3, 0), (WIDTH * i / 3, HEIGHT))
-            pg.draw.line(screen, "black", (0, HEIGHT * i / 3), (WIDTH, HEIGHT * i / 3))
+# returns the smallest of the 8 symmetric versions of a position packed
+# into one int as player mask << 9 | computer mask,
+# positions which only differ by rotation or reflection score the same
+def canonical(p_mask, c_mask):
+    return min(table[p_mask] << 9 | table[c_mask] for table in SYMMETRY_TABLES)
 
-        # draw crosses and circles
-        for row in range(3):
-            for col in range(3):
-                if self.board[row][col] == COMPUTER:
-                    # draw circle
-                    circle_size = WIDTH / 8
-                    pg.draw.circle(
-                        screen,
-                        "black",
-                        (
-                            (WIDTH * col / 3) + WIDTH / 6,
-                            (HEIGHT * row / 3) + HEIGHT / 6,
-                        ),
-                        circle_size,
-                    )
-                    pg.draw.circle(
-                        screen,
-                        "white",
-                        (
-                            (WIDTH * col / 3) + WIDTH / 6,
-                            (HEIGHT * row / 3) + HEIGHT / 6,
-                        ),
-                        circle_size - 1,
-                    )
-                elif self.board[row][col] == PLAYER:
-                    # draw cross
-                    offset = WIDTH / 12
-                    pg.draw.line(
-                        screen,
-                        "black",
-                        (WIDTH * col / 3 + offset, HEIGHT * row / 3 + offset),
-                        (WIDTH * col / 3 + offset * 3, HEIGHT * row / 3 + offset * 3),
-                    )
-                    pg.draw.line(
-                        screen,
-                        "black",
-                        (WIDTH * col / 3 + offset, HEIGHT * row / 3 + offset * 3),
-                        (WIDTH * col / 3 + offset * 3, HEIGHT * row / 3 + offset),
-                    )
 
-    def draw_end_screen(self, screen):
-        # fonts
-        font = pg.font.Font(None, 100)
-        font_small = pg.font.Font(None, 40)
+# returns the index of the symmetry which turns a position into its
+# canonical version
+def canonical_symmetry(p_mask, c_mask):
+    return min(range(8), key=lambda i: (SYMMETRY_TABLES[i][p_mask], SYMMETRY_TABLES[i][c_mask]))
 
-        # texts
-        text_type = ["You Won!", "It's a Tie!", "You Lost!"]
-        text = font.render(text_type[self.result + 1], True, "black")
-        text_klick = font_small.render("Click anywhere to start again", True, "black")
 
-        # draw screen and texts
-        screen.fill("white")
-        screen.blit(
-            text,
-            (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - text.get_height() * 3),
-        )
-        screen.blit(
-            text_klick,
-            (WIDTH // 2 - text.get_width() * 0.6, HEIGHT // 2 - text.get_height()),
-        )
+# returns all possible moves as cell indices, strongest first
+def possible_moves(p_mask, c_mask):
+    return MOVES_FOR_OCCUPIED[p_mask | c_mask]
 
-    # reset board
-    def get_empty_board(self):
-        return [[EMPTY for _ in range(3)] for _ in range(3)]
-        # return [['','','O'],['O','','X'],['X','X','O']] # position from infographic
+
+# checks if the last move ended the game, as the game was still running
+# before it, only the lines through its cell can have been completed
+def check_move_result(p_mask, c_mask, last_move):
+    if (c_mask >> last_move) & 1:
+        mask, won = c_mask, Result.COMPUTER_WON
+    else:
+        mask, won = p_mask, Result.PLAYER_WON
+    for line in LINES_THROUGH[last_move]:
+        if mask & line == line:
+            return won
+
+    # check if board is full (tie)
+    if (p_mask | c_mask) == FULL_BOARD:
+        return Result.TIE
+
+    # Game still running
+    return None
+
+
+# checks if game ends by a tie, win or loss by testing all 8 lines,
+# only generate_opening_book.py uses it for positions without a last
+# move, the game and the searches use the cheaper check_move_result
+def check_game_result(p_mask, c_mask):
+    # the eight lines of WIN_LINES, unrolled
+    if ((p_mask & 0o007) == 0o007 or (p_mask & 0o070) == 0o070 or (p_mask & 0o700) == 0o700
+            or (p_mask & 0o111) == 0o111 or (p_mask & 0o222) == 0o222 or (p_mask & 0o444) == 0o444
+            or (p_mask & 0o421) == 0o421 or (p_mask & 0o124) == 0o124):
+        # player won
+        return Result.PLAYER_WON
+    if ((c_mask & 0o007) == 0o007 or (c_mask & 0o070) == 0o070 or (c_mask & 0o700) == 0o700
+            or (c_mask & 0o111) == 0o111 or (c_mask & 0o222) == 0o222 or (c_mask & 0o444) == 0o444
+            or (c_mask & 0o421) == 0o421 or (c_mask & 0o124) == 0o124):
+        # computer won
+        return Result.COMPUTER_WON
+
+    # check if board is full (tie)
+    if (p_mask | c_mask) == FULL_BOARD:
+        return Result.TIE
+
+    # Game still running
+    return None
 
 
 def main():
@@ -378,7 +595,8 @@ def main():
     parser.add_argument('-c', '--computer', required=False, action="store_true",
         help="Let the computer make the first move instead of the player.")
     parser.add_argument('-m', '--mode', type=str, choices=["random", "minimax", "minimax-ab", "negamax"], default= "minimax-ab",
-        help="Select the algorithm the computer will use to make moves.")
+        help="Select the algorithm the computer will use to make moves. "
+             "minimax-ab plays the moves precomputed in opening_book.py.")
     args = parser.parse_args()
 
     ttt = TicTacToe(Mode.new(args.mode), State.new(args.computer))